@@ -55,8 +55,10 @@ if __name__ == "__main__":
         val_count = int(num * val_split_rate)
 
         test_index = random.sample(images, k=test_count) if test_split_rate > 0 else []
+        # 采样结果在遍历过程中不会变化, 转为集合后成员判断为 O(1), 不必每张图像都重新扫描列表
+        test_index = set(test_index)
         remaining_images = [img for img in images if img not in test_index]
-        eval_index = random.sample(remaining_images, k=val_count)
+        eval_index = set(random.sample(remaining_images, k=val_count))
 
         for index, image in enumerate(images):
             image_path = os.path.join(cla_path, image)
@@ -58,6 +58,7 @@ class class_infernet(object):
 		self.network = network.to(device)
 		self.network = self.network.eval()
 		self.input_shape = input_shape
+		self._canvas = None
 		release_gpu_memory()
 		
 	def image_to_bchw(self, image, target_shape):
@@ -67,7 +68,11 @@ class class_infernet(object):
 		nw=int(iw*scale)
 		nh=int(ih*scale)
 		resized_image=cv2.resize(image,(nw,nh),interpolation=cv2.INTER_CUBIC)
-		new_image=np.full((h,w,3),(128,128,128),dtype=np.uint8)
+		# 复用同尺寸的灰底画布, 避免每张图像都重新申请内存
+		if self._canvas is None or self._canvas.shape[:2] != (h,w):
+			self._canvas=np.empty((h,w,3),dtype=np.uint8)
+		new_image=self._canvas
+		new_image.fill(128)
 		top=(h - nh)//2
 		left=(w - nw)//2
 		new_image[top:top + nh, left:left + nw]=resized_image
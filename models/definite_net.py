@@ -82,7 +82,7 @@ def get_networks(name,num_classes,weights=None):
         model=nn.DataParallel(model)
     else:
         model=model.to(device)
-    if weights != None:
+    if weights is not None:
         # 加载权重的部分不需要再检查设备，因为模型已经在正确的设备上
         print(f'\033[34mLoad weights {weights}. to {name}')
         model_dict = model.state_dict()
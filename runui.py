@@ -11,6 +11,7 @@ import torch.nn.functional as F
 import qimage2ndarray
 from datetime import datetime
 import numpy as np
+from functools import lru_cache
 from models import get_networks_for_ui
 from natsort import natsorted
 
@@ -33,9 +34,14 @@ mindex = ClassificationMetricIndex(num_classes).to(load_owned_device())
 title_ = "基于Pytorch的花卉分类"
 #############################################################
 
+@lru_cache(maxsize=None)
+def load_network_for_ui(name, num_classes, weights_path, device):
+    """同一组参数只构建并加载一次权重, 之后每张图像直接复用"""
+    return get_networks_for_ui(name, num_classes, weights_path).to(device)
+
 def detect_image_ui(image, img_path, mindex):
     device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-    network = get_networks_for_ui(models, num_classes, weights_path).to(device)
+    network = load_network_for_ui(models, num_classes, weights_path, device)
     category = natsorted(categories)
     nw, nh = input_shape
     image = cv2.resize(image, (nw, nh), interpolation=cv2.INTER_CUBIC)
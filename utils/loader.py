@@ -18,6 +18,16 @@ from pathlib import Path
 from natsort import natsorted
 from torch.utils.data import Dataset, DataLoader
 
+_cv2_configured_pid = None
+
+def _configure_cv2_once():
+    """关闭 opencv 的多线程与 OpenCL, 避免与 DataLoader 的多进程冲突, 每个进程只需设置一次"""
+    global _cv2_configured_pid
+    if _cv2_configured_pid != os.getpid():
+        cv2.setNumThreads(0)
+        cv2.ocl.setUseOpenCL(False)
+        _cv2_configured_pid = os.getpid()
+
 class ClassificationDataset(Dataset):
     def __init__(self, root_dir, target_shape, is_train=True, transform=None):
         data_folder = os.path.join(root_dir, 'train') if is_train else os.path.join(root_dir, 'val')
@@ -39,8 +49,7 @@ class ClassificationDataset(Dataset):
         return len(self.data_and_label_list)
     
     def __getitem__(self, index):
-        cv2.setNumThreads(0)
-        cv2.ocl.setUseOpenCL(False)
+        _configure_cv2_once()
         image_path, label = self.data_and_label_list[index]
         label = torch.tensor(label).long()
         image = cv2.imread(image_path, cv2.IMREAD_COLOR)
@@ -59,32 +68,33 @@ class ClassificationDataset(Dataset):
         nw = int(iw * scale)
         nh = int(ih * scale)
         resized_image = cv2.resize(image, (nw, nh), interpolation=cv2.INTER_CUBIC)
-        new_image = np.full((h, w, 3), (128, 128, 128), dtype=np.uint8)
         top = (h - nh) // 2
         left = (w - nw) // 2
-        new_image[top:top + nh, left:left + nw] = resized_image
-        new_image = cv2.cvtColor(new_image, cv2.COLOR_BGR2RGB)
+        # 只填充灰边, 不必先整幅填灰再把缩放后的图像拷贝进去
+        new_image = cv2.copyMakeBorder(resized_image, top, h - nh - top, left, w - nw - left,
+                                       cv2.BORDER_CONSTANT, value=(128, 128, 128))
         if is_train:
             if random.random() > (1 - prob):
                 new_image = np.flip(new_image, axis=1)
             r = random.randint(0, 3)
             new_image = np.rot90(new_image, r, (0, 1))
-            # 转换到HSV颜色空间
-            hsv_image = cv2.cvtColor(new_image, cv2.COLOR_RGB2HSV).astype(np.float32)
-            h_channel, s_channel, v_channel = cv2.split(hsv_image)
+            # 直接从BGR转换到HSV颜色空间, 最后再转回RGB, 省去一次BGR->RGB的转换
+            h_channel, s_channel, v_channel = cv2.split(cv2.cvtColor(new_image, cv2.COLOR_BGR2HSV))
             # 随机调整色调（Hue）
             delta_h = random.randint(-30, 30)
-            h_channel = (h_channel + delta_h) % 180
             # 随机调整饱和度（Saturation）和亮度（Value）
             s_scale = np.random.uniform(0.5, 1.5)
             v_scale = random.uniform(0.5, 1.5)
-            s_channel = np.clip(s_channel * s_scale, 0, 255).astype(np.uint8)
-            v_channel = np.clip(v_channel * v_scale, 0, 255).astype(np.uint8)
+            # 每个通道只有256种取值, 先计算好查找表, 再用cv2.LUT映射, 避免整幅图像的浮点运算
+            x = np.arange(256, dtype=np.float32)
+            lut_h = ((x + delta_h) % 180).astype(np.uint8)
+            lut_s = np.clip(x * s_scale, 0, 255).astype(np.uint8)
+            lut_v = np.clip(x * v_scale, 0, 255).astype(np.uint8)
             # 合并通道并转换回RGB颜色空间
-            hsv_image[..., 0] = h_channel.astype(np.uint8)
-            hsv_image[..., 1] = s_channel
-            hsv_image[..., 2] = v_channel
-            new_image = cv2.cvtColor(hsv_image.astype(np.uint8), cv2.COLOR_HSV2RGB)
+            hsv_image = cv2.merge((cv2.LUT(h_channel, lut_h), cv2.LUT(s_channel, lut_s), cv2.LUT(v_channel, lut_v)))
+            new_image = cv2.cvtColor(hsv_image, cv2.COLOR_HSV2RGB)
+        else:
+            new_image = cv2.cvtColor(new_image, cv2.COLOR_BGR2RGB)
         # 将图像归一化到[0, 1]范围
         new_image = new_image / 255.0
         return new_image
@@ -99,6 +109,9 @@ def show_image_from_dataloader(test_dataset):
         pin_memory=False,
         drop_last=True
     )
+    # 窗口只创建一次, 循环中复用, 结束后再统一销毁
+    window_name = 'show image from dataloader'
+    cv2.namedWindow(window_name, cv2.WINDOW_AUTOSIZE)
     for i, (img, label) in enumerate(loader):
         img = img[0].numpy()
         img = np.transpose(img, (1, 2, 0))
@@ -106,9 +119,9 @@ def show_image_from_dataloader(test_dataset):
         img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
         cv2.putText(img, f"{label.item()}", (30, 30), fontFace=cv2.FONT_HERSHEY_SIMPLEX,
                     fontScale=1, thickness=2, color=(255, 0, 255))
-        cv2.imshow('show image from dataloader', img)
+        cv2.imshow(window_name, img)
         cv2.waitKey(0)
-        cv2.destroyAllWindows()
+    cv2.destroyAllWindows()
 
 if __name__=="__main__":
     from torchvision import transforms
@@ -43,18 +43,14 @@ class ConfusionMatrix(nn.Module):
 
     def ravel(self):
         confusion_matrix = self.matrix.compute()
-        metrics=np.zeros((4,))
         if self.num_classes > 2:
-            for i in range(self.num_classes):
-                TP = confusion_matrix[i,i]
-                FN = torch.sum(confusion_matrix[i,:]).item() - TP
-                FP = torch.sum(confusion_matrix[:,i]).item() - TP
-                # 多分类任务中通常不计算TN,因为对于每个类别,其他所有类别都可以被视为“负类”,这使得TN的计算变得复杂且不直观
-                TN = torch.sum(confusion_matrix).item() - (TP + FN + FP)
-                metrics[0] += TP
-                metrics[1] += FN
-                metrics[2] += FP
-                metrics[3] += TN
+            # 一次性按行、列求和得到每个类别的 TP/FN/FP/TN, 不再逐类别循环并反复 .item() 同步
+            TP = torch.diag(confusion_matrix)
+            FN = confusion_matrix.sum(dim=1) - TP
+            FP = confusion_matrix.sum(dim=0) - TP
+            # 多分类任务中通常不计算TN,因为对于每个类别,其他所有类别都可以被视为“负类”,这使得TN的计算变得复杂且不直观
+            TN = confusion_matrix.sum() - (TP + FN + FP)
+            metrics = torch.stack([TP.sum(), FN.sum(), FP.sum(), TN.sum()]).cpu().numpy().astype(np.float64)
         else:
             metrics = confusion_matrix.flatten().numpy()
 
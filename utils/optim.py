@@ -6,6 +6,15 @@ import torch.optim as optim
 from torch.optim.lr_scheduler import StepLR, CosineAnnealingLR, LambdaLR, MultiStepLR
 from torch.optim.lr_scheduler import _LRScheduler
 
+OPTIMIZER_CLASSES = {
+    "sgd": optim.SGD,
+    "SGD": optim.SGD,
+    "adam": optim.Adam,
+    "Adam": optim.Adam,
+    "adamw": optim.AdamW,
+    "AdamW": optim.AdamW,
+}
+
 def get_optimizer(
     network, optimizer_type = 'adam', init_lr = 0.001, momentum = 0.9, weight_decay = 1e-4
 ):
@@ -23,17 +32,13 @@ def get_optimizer(
         optimizer, scheduler: 返回优化器和学习率调度器。
     """
     # 选择优化器
-    if optimizer_type in ['sgd', 'SGD']:
-        optimizer = optim.SGD(network.parameters(), lr = init_lr, momentum = momentum,
-                              weight_decay = weight_decay)
-    elif optimizer_type in ['adam', 'Adam']:
-        optimizer = optim.Adam(network.parameters(), lr = init_lr,
-                               weight_decay = weight_decay)
-    elif optimizer_type in ['adamw', 'AdamW']:
-        optimizer = optim.AdamW(network.parameters(), lr = init_lr,
-                                weight_decay = weight_decay)
-    else:
+    if optimizer_type not in OPTIMIZER_CLASSES:
         raise ValueError(f"Optimizer {optimizer_type} is not supported.")
+    optimizer_class = OPTIMIZER_CLASSES[optimizer_type]
+    kwargs = dict(lr = init_lr, weight_decay = weight_decay)
+    if optimizer_class is optim.SGD:
+        kwargs['momentum'] = momentum
+    optimizer = optimizer_class(network.parameters(), **kwargs)
     
     return optimizer
 
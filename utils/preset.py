@@ -7,6 +7,7 @@ import cv2
 import torch
 import torch.nn.functional as F
 import numpy as np
+from functools import lru_cache
 from models import get_networks_for_ui
 from natsort import natsorted
 
@@ -28,9 +29,15 @@ device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
 mindex = ClassificationMetricIndex(num_classes).to(device)
 
 
+@lru_cache(maxsize=None)
+def load_network_for_ui(name, num_classes, weights_path, device):
+    """同一组参数只构建并加载一次权重, 之后每张图像直接复用"""
+    return get_networks_for_ui(name, num_classes, weights_path).to(device)
+
+
 def detect_image_ui(image, img_path, mindex):
     device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-    network = get_networks_for_ui(models, num_classes, weights_path).to(device)
+    network = load_network_for_ui(models, num_classes, weights_path, device)
     category = natsorted(categories)
     nw, nh = input_shape
     image = cv2.resize(image, (nw, nh), interpolation=cv2.INTER_CUBIC)
@@ -5,6 +5,7 @@ import os
 import torch
 import re
 import sys
+import numpy as np
 import matplotlib
 matplotlib.use('Agg')
 from matplotlib import pyplot as plt
@@ -24,7 +25,7 @@ class LossHistory():
             device = 'cpu'
             dummy_input = torch.randn(2, 3, input_shape[0], input_shape[1]).to(device)
             self.writer.add_graph(model.to(device), dummy_input)
-        except:
+        except Exception:
             pass
 
     def append_loss(self, epoch, loss, val_loss):
@@ -44,8 +45,9 @@ class LossHistory():
 
     def loss_plot(self):
         iters = range(len(self.losses))
-        losses_cpu = torch.tensor(self.losses).cpu().numpy()
-        val_loss_cpu = torch.tensor(self.val_loss).cpu().numpy()
+        # losses 中存放的都是 python float, 直接转为 numpy 数组即可, 不必经过 torch.tensor 再拷回 cpu
+        losses_cpu = np.asarray(self.losses)
+        val_loss_cpu = np.asarray(self.val_loss)
 
         plt.figure()
         plt.plot(iters, losses_cpu, 'red', linewidth=2, label='train loss')
@@ -61,7 +63,7 @@ class LossHistory():
 
             plt.plot(iters, smoothed_train_loss, 'green', linestyle='--', linewidth=2, label='smooth train loss')
             plt.plot(iters, smoothed_val_loss, '#8B4513', linestyle='--', linewidth=2, label='smooth val loss')
-        except:
+        except Exception:
             pass
 
         plt.grid(True)
@@ -104,18 +106,20 @@ class AverageMeter(object):
         self.avg = self.sum / self.count
         
         
+ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
 class ConsoleLogger:
     def __init__(self, log_file, encoding='utf-8'):
         self.log_file = log_file
         self.clean(self.log_file)
         self.terminal = sys.stdout
         self.encoding = encoding
+        # 日志文件只打开一次, 行缓冲保证每行及时落盘, 不必每次 write 都重新打开关闭文件
+        self.log = open(self.log_file, 'a', encoding=self.encoding, buffering=1)
 
     def write(self, message):
-        message_no_color = self.remove_ansi_colors(message)
-        with open(self.log_file, 'a', encoding=self.encoding) as log:
-            log.write(message_no_color)
-
+        self.log.write(self.remove_ansi_colors(message))
         self.terminal.write(message)
 
     def clean(self,log_file):
@@ -124,6 +128,7 @@ class ConsoleLogger:
 
     def flush(self):
         # 为了兼容一些不支持flush的环境
+        self.log.flush()
         self.terminal.flush()
 
     @staticmethod
@@ -131,9 +136,8 @@ class ConsoleLogger:
         """
         去除 ANSI 颜色代码。
         """
-        # 正则表达式匹配 ANSI 转义序列
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        # 正则表达式匹配 ANSI 转义序列, 已在模块级预编译
+        return ANSI_ESCAPE.sub('', text)
 
 
 def redirect_console(log_path='./out.log'):